@@ -1,11 +1,13 @@
 """Base class for file operations."""
 
 import abc
+import os
+import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Collection, Dict, List, Set, Tuple
 
-from git import Repo
+from git import GitCommandError, Repo
 
 
 @dataclass
@@ -84,6 +86,76 @@ class AsyncOperation:
             raise ValueError(f"Path {path} is not within the root directory: {root_path.as_posix()}")
         return abs_path.as_posix()
 
+    @staticmethod
+    def _join_truncated(lines: List[str], max_chars: int) -> Tuple[str, int, bool]:
+        """Join output lines with newlines, keeping at most max_chars characters.
+
+        The full length is computed without building the full string, so a large
+        output that is going to be truncated anyway is never joined in full.
+
+        Args:
+            lines: Output lines to join
+            max_chars: Maximum characters to keep
+
+        Returns:
+            The (possibly truncated) content, the length of the full content, and whether it was truncated
+
+        """
+        total_chars = sum(map(len, lines)) + max(len(lines) - 1, 0)
+        if total_chars <= max_chars:
+            return "\n".join(lines), total_chars, False
+        kept: List[str] = []
+        kept_chars = 0
+        for line in lines:
+            kept.append(line)
+            kept_chars += len(line) + 1
+            if kept_chars > max_chars:
+                break
+        return "\n".join(kept)[:max_chars], total_chars, True
+
+    def _git_with_paths(self, args: List[str], paths: List[str], ok_statuses: Collection[int] = (0,)) -> List[str]:
+        """Run a git command that reads NUL-separated paths from stdin.
+
+        Feeding the paths through stdin keeps any number of them clear of the command-line
+        length limit, and with NUL separators git never quotes or splits unusual file names.
+
+        Args:
+            args: Git subcommand and options, set up to read ``-z`` style paths from stdin
+            paths: Paths to pass to the command
+            ok_statuses: Exit statuses that count as success
+
+        Returns:
+            The NUL-separated records the command printed
+
+        Raises:
+            GitCommandError: If git exits with a status outside ok_statuses
+
+        """
+        command = [self._repo.git.GIT_PYTHON_GIT_EXECUTABLE, *args]
+        process = self._repo.git.execute(command, istream=subprocess.PIPE, as_process=True)
+        stdout, stderr = process.communicate(b"".join(os.fsencode(path) + b"\0" for path in paths))
+        if process.returncode not in ok_statuses:
+            raise GitCommandError(command, process.returncode, stderr, stdout)
+        return [os.fsdecode(record) for record in stdout.split(b"\0") if record]
+
+    def _ignored_paths(self, relative_paths: List[str]) -> Set[str]:
+        """Return the subset of the given paths that git ignores.
+
+        The whole list goes to a single ``git check-ignore`` process instead of one per file;
+        a GitCommandError propagates if git fails for a reason other than "nothing ignored".
+
+        Args:
+            relative_paths: POSIX paths relative to the root directory
+
+        Returns:
+            The ignored paths, exactly as they were passed in
+
+        """
+        if not relative_paths:
+            return set()
+        # Exit status 1 means none of the paths is ignored
+        return set(self._git_with_paths(["check-ignore", "--stdin", "-z"], relative_paths, ok_statuses=(0, 1)))
+
     @abc.abstractmethod
     async def __call__(
         self,
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from ...core import AsyncOperation
 
@@ -47,39 +47,35 @@ class ReadLinesOperation(AsyncOperation):
         if file_obj.is_dir():
             raise IsADirectoryError(f"Path is a directory, not a file: {file_path}")
 
-        # Read the file
+        # Validate line numbers before reading anything
+        if start is None:
+            start = 1
+        if start < 1:
+            raise ValueError(f"Start line must be at least 1, got {start}")
+        if end is not None and end < start:
+            raise ValueError(f"End line must be greater than or equal to start line, got {end} < {start}")
+
+        # Stream the file, counting every line but keeping only the requested range
+        selected_lines: List[str] = []
+        total_lines = 0
         try:
             with open(file_obj, "r", encoding="utf-8", errors="ignore") as f:
-                all_lines = f.readlines()
+                for total_lines, line in enumerate(f, 1):
+                    if start <= total_lines and (end is None or total_lines <= end):
+                        selected_lines.append(line)
         except (OSError, PermissionError) as e:
             raise ValueError(f"Cannot read file {file_path}: {e}") from e
 
-        total_lines = len(all_lines)
-
-        # Determine line range
-        if start is None:
-            start = 1
+        # An open-ended range runs to the end of the file, which is only known after reading it
         if end is None:
             end = total_lines
-
-        # Validate line numbers
-        if start < 1:
-            raise ValueError(f"Start line must be at least 1, got {start}")
-        if end < start:
-            raise ValueError(f"End line must be greater than or equal to start line, got {end} < {start}")
+            if end < start:
+                raise ValueError(f"End line must be greater than or equal to start line, got {end} < {start}")
 
         # Adjust line numbers to be within file bounds
         actual_start = max(1, min(start, total_lines + 1))
         actual_end = max(actual_start, min(end, total_lines))
 
-        # Extract the requested lines (convert to 0-based indexing)
-        if actual_start > total_lines:
-            selected_lines = []
-        else:
-            start_idx = actual_start - 1
-            end_idx = actual_end
-            selected_lines = all_lines[start_idx:end_idx]
-
         # Prepare output
         content_lines = []
 
@@ -102,12 +98,7 @@ class ReadLinesOperation(AsyncOperation):
             content_lines.append("")
             content_lines.append(f"No lines to display (requested lines {start}-{end}, file has {total_lines} lines)")
 
-        content = "\n".join(content_lines)
-        total_chars = len(content)
-        truncated = total_chars > max_chars
-
-        if truncated:
-            content = content[:max_chars]
+        content, total_chars, truncated = self._join_truncated(content_lines, max_chars)
 
         return {
             "content": content,
@@ -50,37 +50,30 @@ class SearchFilesOperation(AsyncOperation):
                 raise ValueError(f"Root path is not a directory: {root}")
 
         # Search for matching files
-        matching_files: List[str] = []
+        candidates: List[Path] = []
         total_files_scanned = 0
 
         try:
             for file_path in search_root.rglob("*"):
                 total_files_scanned += 1
-                if file_path.is_file():
-                    # Check gitignore using the base class repo
-                    try:
-                        relative_path = file_path.relative_to(self._root_path)
-                        # Skip files ignored by gitignore
-                        if self._repo.ignored(str(relative_path)):
-                            continue
-                    except (ValueError, git.InvalidGitRepositoryError, OSError):
-                        # File is outside root directory or git error, skip hidden files/directories
-                        if any(part.startswith(".") for part in file_path.parts[len(self._root_path.parts) :]):
-                            continue
-
-                    # Check if filename matches pattern
-                    if compiled_pattern.search(file_path.name):
-                        # Get relative path from the project root
-                        try:
-                            relative_path = file_path.relative_to(self._root_path)
-                            matching_files.append(str(relative_path))
-                        except ValueError:
-                            # File is outside root directory, use absolute path
-                            matching_files.append(str(file_path))
-
+                # Check the file name first; only matching files need the gitignore check
+                if file_path.is_file() and compiled_pattern.search(file_path.name):
+                    candidates.append(file_path.relative_to(self._root_path))
         except (OSError, PermissionError) as e:
             raise ValueError(f"Error accessing files in directory: {e}") from e
 
+        try:
+            # Check gitignore using the base class repo, batching all candidates together
+            ignored = self._ignored_paths([relative_path.as_posix() for relative_path in candidates])
+        except (git.InvalidGitRepositoryError, OSError):
+            # Git error, skip hidden files/directories instead
+            ignored = {
+                relative_path.as_posix()
+                for relative_path in candidates
+                if any(part.startswith(".") for part in relative_path.parts)
+            }
+        matching_files = [str(relative_path) for relative_path in candidates if relative_path.as_posix() not in ignored]
+
         # Prepare output
         content_lines = [f"Files matching pattern '{pattern}':", ""]
         for file_str in matching_files:
@@ -89,12 +82,7 @@ class SearchFilesOperation(AsyncOperation):
         if not matching_files:
             content_lines.append("  No files found")
 
-        content = "\n".join(content_lines)
-        total_chars = len(content)
-        truncated = total_chars > max_chars
-
-        if truncated:
-            content = content[:max_chars]
+        content, total_chars, truncated = self._join_truncated(content_lines, max_chars)
 
         return {
             "content": content,
@@ -1,5 +1,7 @@
 """Module for searching text content in files."""
 
+import asyncio
+import io
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,6 +11,55 @@ import git
 
 from ...core import AsyncOperation
 
+# Leading bytes inspected for a NUL when deciding whether a file is binary
+_BINARY_SNIFF_BYTES = 8192
+# A pattern without any of these characters matches only its own text
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _literal_of(pattern: str) -> Optional[str]:
+    """Get the text a pattern matches literally.
+
+    Args:
+        pattern: Regex pattern as given by the caller
+
+    Returns:
+        The pattern itself if it contains no regex metacharacters, otherwise None
+
+    """
+    if pattern and not _REGEX_METACHARACTERS.intersection(pattern):
+        return pattern
+    return None
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file content the way text-mode open() would.
+
+    Args:
+        data: Raw file content
+
+    Returns:
+        The content decoded as UTF-8, dropping undecodable bytes, with universal newlines
+
+    """
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _count_lines(text: str) -> int:
+    """Count the lines of a text without splitting it.
+
+    Args:
+        text: File content read in text mode
+
+    Returns:
+        The number of lines readlines() would return for the same content
+
+    """
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+
 
 @dataclass
 class SearchTextOperation(AsyncOperation):
@@ -49,17 +100,15 @@ class SearchTextOperation(AsyncOperation):
         if files is None:
             # Search all files except those ignored by .gitignore
             try:
-                for file_path in self._root_path.rglob("*"):
-                    if file_path.is_file():
-                        # Get relative path for gitignore check
-                        try:
-                            relative_path = file_path.relative_to(self._root_path)
-                            # Check if file is ignored by gitignore
-                            if not self._repo.ignored(str(relative_path)):
-                                search_files.append(file_path)
-                        except ValueError:
-                            # File is outside root directory, skip it
-                            continue
+                candidates = [file_path for file_path in self._root_path.rglob("*") if file_path.is_file()]
+                relative_paths = [file_path.relative_to(self._root_path).as_posix() for file_path in candidates]
+                # Check the whole tree against gitignore in batches rather than one git call per file
+                ignored = self._ignored_paths(relative_paths)
+                search_files = [
+                    file_path
+                    for file_path, relative_path in zip(candidates, relative_paths, strict=True)
+                    if relative_path not in ignored
+                ]
             except (git.InvalidGitRepositoryError, OSError, PermissionError):
                 # If not a git repo or git error, fall back to all files except hidden
                 for file_path in self._root_path.rglob("*"):
@@ -82,33 +131,49 @@ class SearchTextOperation(AsyncOperation):
         matches: List[Dict[str, Any]] = []
         total_files_searched = 0
         total_lines_searched = 0
+        literal = _literal_of(pattern)
+        # Files named explicitly are always searched; a tree-wide search leaves binaries out
+        skip_binary = files is None
+        # Bound once so the per-line loop does not look them up again
+        search_line = compiled_pattern.search
+        with_context = context is not None and context > 0
 
         for file_path in search_files:
-            total_files_searched += 1
             try:
-                # Try to read as text file
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
+                with open(file_path, "rb") as f:
+                    # Sniff the head first so that binary files are never read in full
+                    head = f.read(_BINARY_SNIFF_BYTES)
+                    if skip_binary and b"\0" in head:
+                        continue
+                    text = _decode_text(head + f.read())
 
+                total_files_searched += 1
+
+                if literal is not None and literal not in text:
+                    # A literal missing from the whole file cannot match any of its lines
+                    total_lines_searched += _count_lines(text)
+                    continue
+
+                lines = io.StringIO(text).readlines()
                 total_lines_searched += len(lines)
 
-                # Find matching lines
-                for line_num, line in enumerate(lines, 1):
-                    if compiled_pattern.search(line):
-                        # Get relative path from project root
-                        try:
-                            relative_path = file_path.relative_to(self._root_path)
-                        except ValueError:
-                            relative_path = file_path
+                # Get relative path from project root, once for all matches in this file
+                try:
+                    display_path = str(file_path.relative_to(self._root_path))
+                except ValueError:
+                    display_path = str(file_path)
 
+                # Find matching lines; a literal pattern needs only a substring test, not the regex engine
+                for line_num, line in enumerate(lines, 1):
+                    if (literal in line) if literal is not None else search_line(line):
                         match_data = {
-                            "file": str(relative_path),
+                            "file": display_path,
                             "line_number": line_num,
                             "line": line.rstrip("\n\r"),
                         }
 
                         # Add context lines if requested
-                        if context is not None and context > 0:
+                        if with_context:
                             start_line = max(0, line_num - 1 - context)
                             end_line = min(len(lines), line_num + context)
 
@@ -123,8 +188,8 @@ class SearchTextOperation(AsyncOperation):
 
                         matches.append(match_data)
 
-            except (UnicodeDecodeError, OSError, PermissionError):
-                # Skip binary files or files with access issues
+            except (OSError, PermissionError):
+                # Skip files with access issues
                 continue
 
         # Prepare output
@@ -144,12 +209,7 @@ class SearchTextOperation(AsyncOperation):
                     # Simple format: file_path:line_number:
                     content_lines.append(f"{match['file']}:{match['line_number']}:")
 
-        content = "\n".join(content_lines)
-        total_chars = len(content)
-        truncated = total_chars > max_chars
-
-        if truncated:
-            content = content[:max_chars]
+        content, total_chars, truncated = self._join_truncated(content_lines, max_chars)
 
         return {
             "content": content,
@@ -182,7 +242,8 @@ class SearchTextOperation(AsyncOperation):
 
         """
         try:
-            result = self._search_text(pattern, files, context, max_chars)
+            # The scan is blocking file I/O and regex work, so keep it off the event loop
+            result = await asyncio.to_thread(self._search_text, pattern, files, context, max_chars)
             return {
                 "status": "success",
                 "message": (
@@ -18,6 +18,8 @@ class GitAddOperation(AsyncOperation):
     ) -> Dict[str, Any]:
         """Add files to the git index.
 
+        The paths are passed to ``git add --pathspec-from-file``, so Git 2.25 or newer is required.
+
         Args:
             paths: List of file paths to add to the git index
 
@@ -32,18 +34,14 @@ class GitAddOperation(AsyncOperation):
         if not isinstance(paths, list):
             raise ValueError("Expected a list of file paths as the argument")
 
-        # Get the repository
-        repo = self._repo
-
-        # Add the files to the index
-        added_files = []
-        for path in paths:
-            # Validate that the path is within the root directory
-            abs_path = self._validate_path_in_root(self._root_path, path)
+        # Validate that every path is within the root directory before touching the index
+        abs_paths = [self._validate_path_in_root(self._root_path, path) for path in paths]
 
-            # Add the file to the index
-            repo.git.add(abs_path)
-            added_files.append(path)
+        # Add the files to the index with a single git call, reading the paths from stdin so
+        # that a long list never runs into the command-line length limit
+        if abs_paths:
+            self._git_with_paths(["add", "--pathspec-from-file=-", "--pathspec-file-nul"], abs_paths)
+        added_files = list(paths)
 
         return {
             "status": "success",
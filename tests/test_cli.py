@@ -1,5 +1,6 @@
 """Tests for the command-line interface."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -49,19 +50,19 @@ class TestCLI:
         mock_fastmcp.run.assert_called_once()
 
     @patch("sys.argv", ["dev_kit_mcp_server", "--root-dir", "/nonexistent/directory"])
-    def test_cli_with_nonexistent_root_dir(self, mock_start_server):
+    def test_cli_with_nonexistent_root_dir(self, mock_start_server, monkeypatch):
         """Test the CLI with a non-existent root directory."""
         # Arrange
         # Make sys.exit raise a custom exception that we can catch
         mock_start_server["exit"].side_effect = SystemExit
+        monkeypatch.setattr(os.path, "isdir", lambda path: False)
 
-        with patch("os.path.isdir", return_value=False):
-            # Act & Assert
-            with pytest.raises(ValueError):
-                main()
+        # Act & Assert
+        with pytest.raises(ValueError):
+            main()
 
-            # The server should not be started if the root directory doesn't exist
-            mock_start_server["start"].assert_not_called()
+        # The server should not be started if the root directory doesn't exist
+        mock_start_server["start"].assert_not_called()
 
     @patch("sys.argv", ["dev_kit_mcp_server"])
     def test_cli_with_keyboard_interrupt(self, mock_start_server):
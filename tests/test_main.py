@@ -1,5 +1,6 @@
 """Tests for the __main__ module."""
 
+import argparse
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,8 +17,7 @@ import pytest
 @pytest.fixture
 def mock_args(temp_dir):
     """Mock the command-line arguments."""
-    mock_args = MagicMock()
-    mock_args.root_dir = temp_dir
+    mock_args = argparse.Namespace(root_dir=temp_dir, copilot_mode=False, commands_toml=None)
 
     with patch("argparse.ArgumentParser.parse_args", return_value=mock_args):
         # Now we can safely import the module
@@ -1,16 +1,32 @@
 """Tests for exploration tools."""
 
+import asyncio
 import os
+import sys
 
 import pytest
+from git import Repo
 
+from dev_kit_mcp_server.core import AsyncOperation
 from dev_kit_mcp_server.tools import ReadLinesOperation, SearchFilesOperation, SearchTextOperation
+from dev_kit_mcp_server.tools.explore import read_lines, search_text
 
+# Ignored file names that git would C-quote in line-based output; quotes, backslashes and tabs are not valid on Windows
+_NOT_ON_WINDOWS = pytest.mark.skipif(sys.platform == "win32", reason="File name is not valid on Windows")
+IGNORED_SPECIAL_NAMES = (
+    pytest.param('quote"d.log', marks=_NOT_ON_WINDOWS, id="quote"),
+    pytest.param("back\\slash.log", marks=_NOT_ON_WINDOWS, id="backslash"),
+    pytest.param("tab\tname.log", marks=_NOT_ON_WINDOWS, id="tab"),
+    pytest.param("caf\u00e9.log", id="non_ascii"),
+)
 
-@pytest.fixture(scope="function")
-def temp_root_dir(temp_dir) -> str:
-    """Create a temporary directory for testing."""
-    return temp_dir
+
+@pytest.fixture(scope="module")
+def temp_root_dir(tmp_path_factory) -> str:
+    """Create a temporary repository shared by the tests of this module, which only read it."""
+    root = tmp_path_factory.mktemp("explore_root")
+    Repo.init(root)
+    return root.as_posix()
 
 
 @pytest.fixture
@@ -31,64 +47,78 @@ def read_lines_operation(temp_root_dir: str) -> ReadLinesOperation:
     return ReadLinesOperation(root_dir=temp_root_dir)
 
 
-@pytest.fixture
-def setup_test_files(temp_root_dir: str) -> dict:
-    """Set up test files and directories for exploration tests."""
+def _write_test_files(root_dir: str) -> dict:
+    """Write the exploration test tree under root_dir and return its file paths."""
     # Create directory structure
-    subdir = os.path.join(temp_root_dir, "subdir")
+    subdir = os.path.join(root_dir, "subdir")
     os.makedirs(subdir)
 
     # Create various test files
     files = {}
 
     # Python file
-    files["python_file"] = os.path.join(temp_root_dir, "test_script.py")
+    files["python_file"] = os.path.join(root_dir, "test_script.py")
     with open(files["python_file"], "w") as f:
-        f.write("#!/usr/bin/env python3\n")
-        f.write("def hello_world():\n")
-        f.write("    print('Hello, World!')\n")
-        f.write("    return 42\n")
-        f.write("\n")
-        f.write("if __name__ == '__main__':\n")
-        f.write("    hello_world()\n")
+        f.write(
+            "#!/usr/bin/env python3\n"
+            "def hello_world():\n"
+            "    print('Hello, World!')\n"
+            "    return 42\n"
+            "\n"
+            "if __name__ == '__main__':\n"
+            "    hello_world()\n"
+        )
 
     # Text file with multiple lines
-    files["text_file"] = os.path.join(temp_root_dir, "sample.txt")
+    files["text_file"] = os.path.join(root_dir, "sample.txt")
     with open(files["text_file"], "w") as f:
-        f.write("Line 1: This is the first line\n")
-        f.write("Line 2: This contains the word 'search'\n")
-        f.write("Line 3: Another line here\n")
-        f.write("Line 4: Final line with search term\n")
-        f.write("Line 5: Last line\n")
+        f.write(
+            "Line 1: This is the first line\n"
+            "Line 2: This contains the word 'search'\n"
+            "Line 3: Another line here\n"
+            "Line 4: Final line with search term\n"
+            "Line 5: Last line\n"
+        )
 
     # Markdown file in subdirectory
     files["markdown_file"] = os.path.join(subdir, "README.md")
     with open(files["markdown_file"], "w") as f:
-        f.write("# Test README\n")
-        f.write("\n")
-        f.write("This is a test markdown file.\n")
-        f.write("It contains some **search** content.\n")
-        f.write("\n")
-        f.write("## Section\n")
-        f.write("More content here.\n")
+        f.write(
+            "# Test README\n"
+            "\n"
+            "This is a test markdown file.\n"
+            "It contains some **search** content.\n"
+            "\n"
+            "## Section\n"
+            "More content here.\n"
+        )
 
     # JSON file
-    files["json_file"] = os.path.join(temp_root_dir, "data.json")
+    files["json_file"] = os.path.join(root_dir, "data.json")
     with open(files["json_file"], "w") as f:
-        f.write("{\n")
-        f.write('  "name": "test",\n')
-        f.write('  "search": true,\n')
-        f.write('  "value": 123\n')
-        f.write("}\n")
+        f.write('{\n  "name": "test",\n  "search": true,\n  "value": 123\n}\n')
 
     # File with special characters in name
-    files["special_file"] = os.path.join(temp_root_dir, "test-file_v2.txt")
+    files["special_file"] = os.path.join(root_dir, "test-file_v2.txt")
     with open(files["special_file"], "w") as f:
         f.write("Special file content\n")
 
     return files
 
 
+@pytest.fixture(scope="module")
+def setup_test_files(temp_root_dir: str) -> dict:
+    """Set up test files and directories for exploration tests."""
+    return _write_test_files(temp_root_dir)
+
+
+@pytest.fixture
+def writable_root_dir(temp_dir: str) -> str:
+    """Set up a private copy of the test tree for tests that add files to it."""
+    _write_test_files(temp_dir)
+    return temp_dir
+
+
 class TestSearchFilesOperation:
     """Test the SearchFilesOperation class."""
 
@@ -102,6 +132,35 @@ class TestSearchFilesOperation:
         assert "test_script.py" in result["content"]
         assert not result["truncated"]
 
+    @pytest.mark.asyncio
+    async def test_search_files_skips_gitignored_files(self, writable_root_dir):
+        """Test that files matched by .gitignore are not reported."""
+        with open(os.path.join(writable_root_dir, ".gitignore"), "w") as f:
+            f.write("sample.txt\n")
+        search_files_operation = SearchFilesOperation(root_dir=writable_root_dir)
+
+        result = await search_files_operation(pattern=".*\\.txt$")
+
+        assert result["status"] == "success"
+        assert result["matches_found"] == 1
+        assert "test-file_v2.txt" in result["content"]
+        assert "sample.txt" not in result["content"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("file_name", IGNORED_SPECIAL_NAMES)
+    async def test_search_files_skips_gitignored_special_names(self, writable_root_dir, file_name):
+        """Test that ignored files are left out even when git would quote their names."""
+        with open(os.path.join(writable_root_dir, ".gitignore"), "w") as f:
+            f.write("*.log\n")
+        with open(os.path.join(writable_root_dir, file_name), "w") as f:
+            f.write("search\n")
+        search_files_operation = SearchFilesOperation(root_dir=writable_root_dir)
+
+        result = await search_files_operation(pattern="log")
+
+        assert result["status"] == "success"
+        assert result["matches_found"] == 0
+
     @pytest.mark.asyncio
     async def test_search_files_multiple_matches(self, search_files_operation, setup_test_files):
         """Test file search with multiple matches."""
@@ -178,6 +237,81 @@ class TestSearchTextOperation:
         assert "search" in result["content"]
         assert not result["truncated"]
 
+    @pytest.mark.asyncio
+    async def test_search_text_skips_gitignored_files(self, writable_root_dir):
+        """Test that files matched by .gitignore are not searched."""
+        with open(os.path.join(writable_root_dir, ".gitignore"), "w") as f:
+            f.write("*.json\nsubdir/\n")
+        search_text_operation = SearchTextOperation(root_dir=writable_root_dir)
+
+        result = await search_text_operation(pattern="search")
+
+        assert result["status"] == "success"
+        assert "sample.txt:2:" in result["content"]
+        assert "data.json" not in result["content"]
+        assert "README.md" not in result["content"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("file_name", IGNORED_SPECIAL_NAMES)
+    async def test_search_text_skips_gitignored_special_names(self, writable_root_dir, file_name):
+        """Test that ignored files are not searched even when git would quote their names."""
+        with open(os.path.join(writable_root_dir, ".gitignore"), "w") as f:
+            f.write("*.log\n")
+        with open(os.path.join(writable_root_dir, file_name), "w") as f:
+            f.write("search\n")
+        search_text_operation = SearchTextOperation(root_dir=writable_root_dir)
+
+        result = await search_text_operation(pattern="search")
+
+        assert result["status"] == "success"
+        assert ".log" not in result["content"]
+
+    @pytest.mark.asyncio
+    async def test_search_text_skips_binary_files_in_tree_search(self, writable_root_dir):
+        """Test that files with NUL bytes are left out of tree searches but searched when named."""
+        with open(os.path.join(writable_root_dir, "blob.bin"), "wb") as f:
+            f.write(b"\x00\x01search\n")
+        search_text_operation = SearchTextOperation(root_dir=writable_root_dir)
+
+        tree_result = await search_text_operation(pattern="search")
+        named_result = await search_text_operation(pattern="search", files=["blob.bin"])
+
+        assert "blob.bin" not in tree_result["content"]
+        assert named_result["matches_found"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_text_reads_only_the_head_of_binary_files(self, writable_root_dir, monkeypatch):
+        """Test that a tree search stops reading a binary file after sniffing its head."""
+        with open(os.path.join(writable_root_dir, "large.bin"), "wb") as f:
+            f.write(b"\x00" + b"search\n" * (1 << 17))
+        bytes_read = {}
+
+        class _CountingFile:
+            def __init__(self, path, mode):
+                self._file = open(path, mode)
+                self._name = os.path.basename(path)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                self._file.close()
+                return False
+
+            def read(self, size=-1):
+                data = self._file.read(size)
+                bytes_read[self._name] = bytes_read.get(self._name, 0) + len(data)
+                return data
+
+        monkeypatch.setattr(search_text, "open", _CountingFile, raising=False)
+        search_text_operation = SearchTextOperation(root_dir=writable_root_dir)
+
+        result = await search_text_operation(pattern="search")
+
+        assert "large.bin" not in result["content"]
+        assert bytes_read["large.bin"] <= search_text._BINARY_SNIFF_BYTES
+        assert bytes_read["sample.txt"] == os.path.getsize(os.path.join(writable_root_dir, "sample.txt"))
+
     @pytest.mark.asyncio
     async def test_search_text_specific_files(self, search_text_operation, setup_test_files):
         """Test text search in specific files."""
@@ -188,6 +322,35 @@ class TestSearchTextOperation:
         assert "sample.txt:2:" in result["content"]
         assert "sample.txt:4:" in result["content"]
 
+    @pytest.mark.asyncio
+    async def test_search_text_counts_lines_of_files_without_match(self, search_text_operation, setup_test_files):
+        """Test that files skipped for lacking a literal pattern still count towards lines searched."""
+        result = await search_text_operation(pattern="search", files=["sample.txt", "test_script.py"])
+
+        assert result["status"] == "success"
+        assert result["matches_found"] == 2
+        assert result["files_searched"] == 2
+        assert result["lines_searched"] == 12  # 5 lines in sample.txt + 7 in test_script.py
+
+    @pytest.mark.asyncio
+    async def test_search_text_concurrent_calls(self, writable_root_dir):
+        """Test that concurrent searches, including tree-wide ones, each get their own results."""
+        with open(os.path.join(writable_root_dir, ".gitignore"), "w") as f:
+            f.write("*.json\n")
+        search_text_operation = SearchTextOperation(root_dir=writable_root_dir)
+
+        results = await asyncio.gather(
+            search_text_operation(pattern="search", files=["sample.txt"]),
+            search_text_operation(pattern="def ", files=["test_script.py"]),
+            search_text_operation(pattern="missing", files=["sample.txt"]),
+            *(search_text_operation(pattern="search") for _ in range(4)),
+        )
+
+        assert [result["status"] for result in results] == ["success"] * 7
+        # Tree-wide: two lines in sample.txt and one in README.md, with data.json ignored
+        assert [result["matches_found"] for result in results] == [2, 1, 0, 3, 3, 3, 3]
+        assert all("data.json" not in result["content"] for result in results[3:])
+
     @pytest.mark.asyncio
     async def test_search_text_with_context(self, search_text_operation, setup_test_files):
         """Test text search with context lines."""
@@ -263,56 +426,28 @@ class TestReadLinesOperation:
     """Test the ReadLinesOperation class."""
 
     @pytest.mark.asyncio
-    async def test_read_lines_entire_file(self, read_lines_operation, setup_test_files):
-        """Test reading entire file."""
-        result = await read_lines_operation(file_path="sample.txt")
+    @pytest.mark.parametrize(
+        "start,end,actual_start,actual_end",
+        [
+            (None, None, 1, 5),
+            (2, 4, 2, 4),
+            (3, None, 3, 5),
+            (None, 3, 1, 3),
+        ],
+        ids=["entire_file", "range", "start_only", "end_only"],
+    )
+    async def test_read_lines_range(self, read_lines_operation, setup_test_files, start, end, actual_start, actual_end):
+        """Test reading the whole file or a specific line range."""
+        result = await read_lines_operation(file_path="sample.txt", start=start, end=end)
 
         assert result["status"] == "success"
-        assert result["lines_returned"] == 5
+        assert result["lines_returned"] == actual_end - actual_start + 1
         assert result["total_lines_in_file"] == 5
-        assert "Line 1:" in result["content"]
-        assert "Line 5:" in result["content"]
+        assert result["actual_start"] == actual_start
+        assert result["actual_end"] == actual_end
         assert not result["truncated"]
-
-    @pytest.mark.asyncio
-    async def test_read_lines_range(self, read_lines_operation, setup_test_files):
-        """Test reading specific line range."""
-        result = await read_lines_operation(file_path="sample.txt", start=2, end=4)
-
-        assert result["status"] == "success"
-        assert result["lines_returned"] == 3
-        assert result["actual_start"] == 2
-        assert result["actual_end"] == 4
-        assert "Line 2:" in result["content"]
-        assert "Line 3:" in result["content"]
-        assert "Line 4:" in result["content"]
-        assert "Line 1:" not in result["content"]
-        assert "Line 5:" not in result["content"]
-
-    @pytest.mark.asyncio
-    async def test_read_lines_start_only(self, read_lines_operation, setup_test_files):
-        """Test reading from specific start line to end."""
-        result = await read_lines_operation(file_path="sample.txt", start=3)
-
-        assert result["status"] == "success"
-        assert result["lines_returned"] == 3
-        assert result["actual_start"] == 3
-        assert result["actual_end"] == 5
-        assert "Line 3:" in result["content"]
-        assert "Line 5:" in result["content"]
-
-    @pytest.mark.asyncio
-    async def test_read_lines_end_only(self, read_lines_operation, setup_test_files):
-        """Test reading from start to specific end line."""
-        result = await read_lines_operation(file_path="sample.txt", end=3)
-
-        assert result["status"] == "success"
-        assert result["lines_returned"] == 3
-        assert result["actual_start"] == 1
-        assert result["actual_end"] == 3
-        assert "Line 1:" in result["content"]
-        assert "Line 3:" in result["content"]
-        assert "Line 4:" not in result["content"]
+        for line_num in range(1, 6):
+            assert (f"Line {line_num}:" in result["content"]) == (actual_start <= line_num <= actual_end)
 
     @pytest.mark.asyncio
     async def test_read_lines_out_of_bounds(self, read_lines_operation, setup_test_files):
@@ -339,6 +474,30 @@ class TestReadLinesOperation:
         assert result["status"] == "error"
         assert "End line must be greater than or equal to start line" in result["message"]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "start,end,message",
+        [
+            (0, None, "Start line must be at least 1"),
+            (4, 2, "End line must be greater than or equal to start line"),
+        ],
+        ids=["zero_start", "end_before_start"],
+    )
+    async def test_read_lines_invalid_range_skips_reading(
+        self, read_lines_operation, setup_test_files, monkeypatch, start, end, message
+    ):
+        """Test that an invalid range is rejected without opening the file."""
+
+        def _fail_open(*args, **kwargs):
+            raise AssertionError("the file should not be opened")
+
+        monkeypatch.setattr(read_lines, "open", _fail_open, raising=False)
+
+        result = await read_lines_operation(file_path="sample.txt", start=start, end=end)
+
+        assert result["status"] == "error"
+        assert message in result["message"]
+
     @pytest.mark.asyncio
     async def test_read_lines_max_chars(self, read_lines_operation, setup_test_files):
         """Test reading with character limit."""
@@ -383,3 +542,16 @@ class TestReadLinesOperation:
         assert result["lines_returned"] == 3
         assert "# Test README" in result["content"]
         assert os.path.normpath(subdir_path) in result["content"]
+
+
+@pytest.mark.parametrize("max_chars", [0, 3, 4, 5, 8, 9, 13, 14, 100])
+def test_join_truncated_matches_full_join(max_chars):
+    """Test that truncated output is exactly the full join cut at max_chars."""
+    lines = ["abc", "", "defg", "hi", ""]
+    full = "\n".join(lines)
+
+    content, total_chars, truncated = AsyncOperation._join_truncated(lines, max_chars)
+
+    assert content == full[:max_chars]
+    assert total_chars == len(full)
+    assert truncated == (len(full) > max_chars)
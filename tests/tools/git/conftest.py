@@ -1,5 +1,6 @@
 """Tests for the Git operations."""
 
+import shutil
 from pathlib import Path
 from typing import Any, Callable
 
@@ -13,18 +14,35 @@ from dev_kit_mcp_server.tools.git import (
 )
 
 
-@pytest.fixture(scope="function")
-def temp_dir_git(temp_dir: str) -> str:
-    """Create a temporary directory for testing."""
-    repo = Repo(temp_dir)
+@pytest.fixture(scope="session")
+def seed_repo_dir(tmp_path_factory) -> Path:
+    """Create a repository with an initial commit once, to be copied for each test."""
+    seed_dir = tmp_path_factory.mktemp("seed_repo")
+    repo = Repo.init(seed_dir)
     cr = repo.config_writer(config_level="repository")
     cr.set_value("user", "name", "Test User")
     cr.set_value("user", "email", "TestUser@forgit.tests")
-    dummy_file = Path(temp_dir) / "dummy.txt"
+    cr.release()
+    dummy_file = seed_dir / "dummy.txt"
     dummy_file.write_text("This is a dummy file.")
     repo.index.add([dummy_file])
     repo.index.commit("Add dummy file")
-    return Path(temp_dir).as_posix()
+    repo.close()
+    return seed_dir
+
+
+@pytest.fixture(scope="function")
+def git_repo(tmp_path: Path, seed_repo_dir: Path) -> Repo:
+    """Create a repository with an initial commit for testing."""
+    # Copying the seeded repository is cheaper than running git init and committing for every test
+    shutil.copytree(seed_repo_dir, tmp_path, dirs_exist_ok=True)
+    return Repo(tmp_path)
+
+
+@pytest.fixture(scope="function")
+def temp_dir_git(tmp_path: Path, git_repo: Repo) -> str:
+    """Create a temporary directory for testing."""
+    return tmp_path.as_posix()
 
 
 @pytest.fixture
@@ -45,28 +63,37 @@ def git_add_operation(temp_dir_git: str) -> GitAddOperation:
     return GitAddOperation(root_dir=temp_dir_git)
 
 
+class _ErrorRepo:
+    """Stateless repository stub that raises an exception when accessing git attribute."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        if name == "git":
+            raise Exception("Simulated error")
+        return None
+
+
+_ERROR_REPO = _ErrorRepo()
+
+
 @pytest.fixture
 def mock_repo_error() -> Callable[[Any], None]:
     """Create a mock repository that raises an exception when accessing git attribute."""
 
-    class MockRepo:
-        def __getattr__(self, name):
-            if name == "git":
-                raise Exception("Simulated error")
-            return None
-
     def _apply_mock(operation: Any) -> None:
-        operation._repo = MockRepo()
+        operation._repo = _ERROR_REPO
 
     return _apply_mock
 
 
-def test_temp_dir_git(temp_dir_git):
+def test_temp_dir_git(temp_dir_git, git_repo):
     """Test the temporary directory fixture."""
-    temp_repo = Repo(temp_dir_git)
+    temp_repo = git_repo
 
     assert temp_repo is not None
     assert temp_repo.working_tree_dir is not None
+    assert Path(temp_repo.working_tree_dir).resolve() == Path(temp_dir_git).resolve()
     assert (Path(temp_repo.working_tree_dir) / "dummy.txt").exists()
     assert (Path(temp_repo.working_tree_dir) / "dummy.txt").read_text() == "This is a dummy file."
     assert temp_repo.head.commit.message == "Add dummy file"
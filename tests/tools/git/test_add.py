@@ -1,10 +1,11 @@
 """Tests for the GitAddOperation class."""
 
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
-from git import Repo
+from git import Git, Repo
 
 from dev_kit_mcp_server.tools.git import GitAddOperation
 
@@ -53,7 +54,18 @@ def create_test_files(temp_dir: str, file_count: int = 1) -> List[str]:
             },
             False,  # should_raise
         ),
-        # Test case 3: Add a nonexistent file
+        # Test case 3: Add many files in a single call
+        (
+            [f"test_file_{i}.txt" for i in range(100)],  # file_paths
+            100,  # setup_files (create 100 files)
+            {
+                "status": "success",
+                "file_count": 100,
+                "message_contains": "Successfully added 100 files to the index",
+            },
+            False,  # should_raise
+        ),
+        # Test case 4: Add a nonexistent file
         (
             ["nonexistent_file.txt"],  # file_paths
             0,  # setup_files (don't create any files)
@@ -61,11 +73,12 @@ def create_test_files(temp_dir: str, file_count: int = 1) -> List[str]:
             True,  # should_raise
         ),
     ],
-    ids=["single_file", "multiple_files", "nonexistent_file"],
+    ids=["single_file", "multiple_files", "many_files", "nonexistent_file"],
 )
 async def test_git_add_operation(
     git_add_operation: GitAddOperation,
     temp_dir_git: str,
+    git_repo: Repo,
     file_paths: List[str],
     setup_files: int,
     expected_result: Dict[str, Any],
@@ -90,11 +103,9 @@ async def test_git_add_operation(
         assert len(result["added_files"]) == expected_result["file_count"]
         assert set(result["added_files"]) == set(file_paths)
 
-        # Check that the files are in the index
-        repo = Repo(temp_dir_git)
-        staged_files = [item.a_path for item in repo.index.diff("HEAD")]
-        for file in file_paths:
-            assert file in staged_files
+        # Check that the files are in the index; they were untracked before, so this means they were staged
+        staged_files = {path for path, _stage in git_repo.index.entries}
+        assert set(file_paths) <= staged_files
 
 
 @pytest.mark.asyncio
@@ -118,3 +129,59 @@ async def test_git_add_operation_exception(git_add_operation: GitAddOperation, m
     # Attempt to add the file - should raise the simulated error
     with pytest.raises(Exception, match="Simulated error"):
         await git_add_operation([test_file.name])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "with space.txt",
+        pytest.param(
+            'with"quote.txt',
+            marks=pytest.mark.skipif(sys.platform == "win32", reason="Windows file names cannot contain quotes"),
+        ),
+        "-leading-dash.txt",
+        "--force",
+    ],
+    ids=["space", "quote", "leading_dash", "option_like"],
+)
+async def test_git_add_operation_special_names(
+    git_add_operation: GitAddOperation, temp_dir_git: str, git_repo: Repo, file_name: str
+):
+    """Test that file names git could quote or read as options are staged as given."""
+    (Path(temp_dir_git) / file_name).write_text("content")
+
+    result = await git_add_operation([file_name])
+
+    assert result["added_files"] == [file_name]
+    staged_files = {path for path, _stage in git_repo.index.entries}
+    assert file_name in staged_files
+
+
+@pytest.mark.asyncio
+async def test_git_add_operation_long_list(
+    git_add_operation: GitAddOperation, temp_dir_git: str, git_repo: Repo, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a list longer than the command-line limit is staged through a short git command line."""
+    # 2000 names of ~100 characters add up to ~200 KB, well past the 32 KB Windows command-line limit
+    file_paths = [f"{'x' * 90}_{i:04d}.txt" for i in range(2000)]
+    for file_path in file_paths:
+        (Path(temp_dir_git) / file_path).write_text("content")
+
+    commands = []
+    execute = Git.execute
+
+    def _record_execute(self, command, *args, **kwargs):
+        commands.append(command)
+        return execute(self, command, *args, **kwargs)
+
+    monkeypatch.setattr(Git, "execute", _record_execute)
+
+    result = await git_add_operation(file_paths)
+
+    assert len(result["added_files"]) == len(file_paths)
+    staged_files = {path for path, _stage in git_repo.index.entries}
+    assert set(file_paths) <= staged_files
+    # The paths went through stdin, so the command line stays a handful of arguments
+    assert len(commands) == 1
+    assert sum(len(str(arg)) for arg in commands[0]) < 1000
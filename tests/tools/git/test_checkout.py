@@ -54,7 +54,7 @@ from dev_kit_mcp_server.tools.git import GitCheckoutOperation
 )
 async def test_git_checkout_operation(
     git_checkout_operation: GitCheckoutOperation,
-    temp_dir_git: str,
+    git_repo: Repo,
     branch_name: str,
     create: bool,
     setup_branch: bool,
@@ -64,9 +64,8 @@ async def test_git_checkout_operation(
 ):
     """Test the GitCheckoutOperation class with various scenarios."""
     # Setup: Create a branch if needed
-    repo = Repo(temp_dir_git)
     if setup_branch:
-        repo.git.branch(branch_name)
+        git_repo.create_head(branch_name)
 
     if should_raise:
         # For nonexistent branch, we expect an exception
@@ -83,10 +82,9 @@ async def test_git_checkout_operation(
         assert result["created"] == expected_result["created"]
 
         # Verify: Check if the branch exists and is checked out
-        branches = [b.name for b in repo.branches]
-        assert (branch_name in branches) == expected_branch_exists
+        assert (branch_name in git_repo.heads) == expected_branch_exists
         if expected_branch_exists:
-            assert repo.active_branch.name == branch_name
+            assert git_repo.active_branch.name == branch_name
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,6 @@
 """Tests for the GitCommitOperation class."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 from git import Repo
@@ -14,16 +14,20 @@ def git_commit_operation(temp_dir_git: str) -> GitCommitOperation:
     return GitCommitOperation(root_dir=temp_dir_git)
 
 
+@pytest.fixture
+def mock_repo(git_commit_operation: GitCommitOperation, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the operation's repository with a mock whose commit returns a fixed hash."""
+    repo = MagicMock()
+    repo.git.commit.return_value = "abcdef1234567890"
+    monkeypatch.setattr(git_commit_operation, "_repo", repo)
+    return repo
+
+
 @pytest.mark.asyncio
-async def test_git_commit_operation(git_commit_operation: GitCommitOperation):
+async def test_git_commit_operation(git_commit_operation: GitCommitOperation, mock_repo: MagicMock):
     """Test the GitCommitOperation class with a valid commit message."""
-    # Mock the repository
-    with patch.object(git_commit_operation, "_repo") as mock_repo:
-        # Set up the git.commit method to return a commit hash
-        mock_repo.git.commit.return_value = "abcdef1234567890"
-
-        # Commit changes
-        result = await git_commit_operation("Test commit message")
+    # Commit changes
+    result = await git_commit_operation("Test commit message")
 
     # Check the result
     assert result["status"] == "success"
@@ -35,12 +39,10 @@ async def test_git_commit_operation(git_commit_operation: GitCommitOperation):
 
 
 @pytest.mark.asyncio
-async def test_git_commit_operation_empty_message(git_commit_operation: GitCommitOperation):
+async def test_git_commit_operation_empty_message(git_commit_operation: GitCommitOperation, mock_repo: MagicMock):
     """Test the GitCommitOperation class with an empty commit message."""
-    # Mock the repository
-    with patch.object(git_commit_operation, "_repo") as mock_repo:
-        # Commit changes with an empty message
-        result = await git_commit_operation("")
+    # Commit changes with an empty message
+    result = await git_commit_operation("")
 
     # Check the result
     assert "error" in result
@@ -51,20 +53,18 @@ async def test_git_commit_operation_empty_message(git_commit_operation: GitCommi
 
 
 @pytest.mark.asyncio
-async def test_git_commit_operation_exception(git_commit_operation: GitCommitOperation):
+async def test_git_commit_operation_exception(git_commit_operation: GitCommitOperation, mock_repo: MagicMock):
     """Test the GitCommitOperation class when an exception occurs."""
-    # Mock the repository
-    with patch.object(git_commit_operation, "_repo") as mock_repo:
-        # Set up the git.commit method to raise an exception
-        mock_repo.git.commit.side_effect = Exception("No changes to commit")
+    # Set up the git.commit method to raise an exception
+    mock_repo.git.commit.side_effect = Exception("No changes to commit")
 
-        # Attempt to commit changes - should raise the exception
-        with pytest.raises(Exception, match="No changes to commit"):
-            await git_commit_operation("Test commit message")
+    # Attempt to commit changes - should raise the exception
+    with pytest.raises(Exception, match="No changes to commit"):
+        await git_commit_operation("Test commit message")
 
 
 @pytest.mark.asyncio
-async def test_git_commit_operation_real_repo(temp_dir_git: str):
+async def test_git_commit_operation_real_repo(temp_dir_git: str, git_repo: Repo):
     """Test the GitCommitOperation class with a real repository."""
     # Create a real GitCommitOperation instance
     operation = GitCommitOperation(root_dir=temp_dir_git)
@@ -76,8 +76,7 @@ async def test_git_commit_operation_real_repo(temp_dir_git: str):
     test_file.write_text("This is a test file for commit operation.")
 
     # Add the file to the index
-    repo = Repo(temp_dir_git)
-    repo.git.add(str(test_file))
+    git_repo.index.add([test_file.name])
 
     # Commit the changes
     result = await operation("Test commit from real repo")
@@ -88,5 +87,4 @@ async def test_git_commit_operation_real_repo(temp_dir_git: str):
     assert result["commit"] is not None
 
     # Verify the commit was actually made
-    repo = Repo(temp_dir_git)
-    assert repo.head.commit.message.strip() == "Test commit from real repo"
+    assert git_repo.head.commit.message.strip() == "Test commit from real repo"
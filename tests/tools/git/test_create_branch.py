@@ -67,7 +67,7 @@ from dev_kit_mcp_server.tools.git import GitCreateBranchOperation
 )
 async def test_git_create_branch_operation(
     git_create_branch_operation: GitCreateBranchOperation,
-    temp_dir_git: str,
+    git_repo: Repo,
     new_branch: str,
     source_branch: Optional[str],
     setup_source: bool,
@@ -78,14 +78,12 @@ async def test_git_create_branch_operation(
 ):
     """Test the GitCreateBranchOperation class with various scenarios."""
     # Setup: Create branches if needed
-    repo = Repo(temp_dir_git)
-
     if setup_source and source_branch:
-        repo.git.branch(source_branch)
+        git_repo.create_head(source_branch)
 
     # For the "existing branch" test case
     if new_branch == "existing-branch":
-        repo.git.branch(new_branch)
+        git_repo.create_head(new_branch)
 
     if should_raise:
         # For error cases, we expect an exception
@@ -102,10 +100,9 @@ async def test_git_create_branch_operation(
         assert result["source_branch"] == expected_result["source_branch"]
 
         # Verify: Check if the branch exists and is checked out
-        branches = [b.name for b in repo.branches]
-        assert (new_branch in branches) == expected_branch_exists
+        assert (new_branch in git_repo.heads) == expected_branch_exists
         if expected_branch_exists:
-            assert repo.active_branch.name == new_branch
+            assert git_repo.active_branch.name == new_branch
 
 
 @pytest.mark.asyncio
@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 import pytest
+from git import Repo
 
 from dev_kit_mcp_server.tools.git import GitDiffOperation
 
@@ -70,7 +71,7 @@ async def test_git_diff_operation_exception(git_diff_operation: GitDiffOperation
 
 
 @pytest.mark.asyncio
-async def test_git_diff_operation_real_repo(temp_dir_git: str):
+async def test_git_diff_operation_real_repo(temp_dir_git: str, git_repo: Repo):
     """Test the GitDiffOperation class with a real repository."""
     # Create a real GitDiffOperation instance
     operation = GitDiffOperation(root_dir=temp_dir_git)
@@ -82,10 +83,7 @@ async def test_git_diff_operation_real_repo(temp_dir_git: str):
     test_file.write_text("This is a test file for diff operation.")
 
     # Add the file to the index
-    from git import Repo
-
-    repo = Repo(temp_dir_git)
-    repo.git.add(str(test_file))
+    git_repo.index.add([test_file.name])
 
     # Modify the file
     test_file.write_text("This is a modified test file for diff operation.")
@@ -1,12 +1,26 @@
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from dev_kit_mcp_server.tools import ExecMakeTarget, PredefinedCommands
 
 
+class _NullFile:
+    """Context-manager stand-in for a file whose content is parsed by a mocked loader."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+def _null_open(*args, **kwargs):
+    return _NullFile()
+
+
 @pytest.fixture
 def mock_subprocess():
     """Mock the subprocess functionality."""
@@ -19,12 +33,12 @@ def mock_subprocess():
 
 
 @pytest.fixture
-def exec_make_target(temp_dir):
+def exec_make_target(temp_dir, monkeypatch):
     """Create an ExecMakeTarget instance with a mocked Makefile."""
-    # Create a mock for Path.exists to simulate Makefile existence
-    with patch("pathlib.Path.exists", return_value=True):
-        tool = ExecMakeTarget(root_dir=temp_dir)
-        yield tool
+    # Simulate Makefile existence only while the tool is constructed
+    with monkeypatch.context() as m:
+        m.setattr(Path, "exists", lambda self: True)
+        return ExecMakeTarget(root_dir=temp_dir)
 
 
 @pytest.mark.asyncio
@@ -144,12 +158,23 @@ def mock_tomllib_load():
 
 
 @pytest.fixture
-def predefined_commands(mock_tomllib_load, temp_dir):
+def predefined_commands(mock_tomllib_load, temp_dir, monkeypatch):
     """Create a PredefinedCommands instance with mocked pyproject.toml."""
-    # Create a mock for Path.exists to simulate pyproject.toml existence
-    with patch("pathlib.Path.exists", return_value=True), patch("builtins.open", MagicMock()):
-        tool = PredefinedCommands(root_dir=temp_dir)
-        yield tool
+    # Simulate pyproject.toml existence only while the tool is constructed
+    with monkeypatch.context() as m:
+        m.setattr(Path, "exists", lambda self: True)
+        m.setattr("builtins.open", _null_open)
+        return PredefinedCommands(root_dir=temp_dir)
+
+
+@pytest.fixture
+def sub_process(predefined_commands, monkeypatch):
+    """Install a mocked subprocess that exits successfully on the PredefinedCommands instance."""
+    process = AsyncMock()
+    process.communicate.return_value = (b"command output", b"")
+    process.returncode = 0
+    monkeypatch.setattr(predefined_commands, "create_sub_proccess", AsyncMock(return_value=process))
+    return process
 
 
 @pytest.mark.asyncio
@@ -168,30 +193,33 @@ async def test_predefined_commands_init(temp_dir):
         assert tool._commands_config == {}
 
     # Test with existing directory and pyproject.toml but error loading
+    # The TOML loader is mocked, so the stubbed open() only has to last for the constructor call
     with (
         patch("pathlib.Path.exists") as mock_exists,
-        patch("builtins.open", MagicMock()),
         patch("dev_kit_mcp_server.core.tomllib.load") as mock_load,
+        patch("builtins.open", _null_open),
     ):
         mock_exists.side_effect = [True, True]
         mock_load.side_effect = Exception("Error loading file")
 
         # Should not raise exception, just log error and continue with empty commands
         tool = PredefinedCommands(root_dir=temp_dir)
-        assert tool._pyproject_exists is True
-        assert tool._commands_config == {}  # Test with existing directory and valid pyproject.toml
+    assert tool._pyproject_exists is True
+    assert tool._commands_config == {}
+
+    # Test with existing directory and valid pyproject.toml
     with (
         patch("pathlib.Path.exists") as mock_exists,
-        patch("builtins.open", MagicMock()),
         patch("dev_kit_mcp_server.core.tomllib.load") as mock_load,
+        patch("builtins.open", _null_open),
     ):
         mock_exists.side_effect = [True, True]
         mock_load.return_value = {"tool": {"dkmcp": {"commands": {"test": "pytest", "lint": "ruff check"}}}}
 
         tool = PredefinedCommands(root_dir=temp_dir)
-        assert tool._pyproject_exists is True
-        assert tool._commands_config == {"test": "pytest", "lint": "ruff check"}
-        assert tool.name == "predefined_commands"
+    assert tool._pyproject_exists is True
+    assert tool._commands_config == {"test": "pytest", "lint": "ruff check"}
+    assert tool.name == "predefined_commands"
 
 
 @pytest.mark.asyncio
@@ -252,43 +280,31 @@ async def test_predefined_commands_exec_command_not_found(predefined_commands):
 
 
 @pytest.mark.asyncio
-async def test_predefined_commands_exec_success(predefined_commands):
+async def test_predefined_commands_exec_success(predefined_commands, sub_process):
     """Test successful execution of a command."""
-    # Mock the create_sub_proccess method
-    mock_process = AsyncMock()
-    mock_process.communicate.return_value = (b"command output", b"")
-    mock_process.returncode = 0
-
-    with patch.object(predefined_commands, "create_sub_proccess", return_value=mock_process):
-        result = {}
-        await predefined_commands._exec_commands("test", result)
+    result = {}
+    await predefined_commands._exec_commands("test", result)
 
-        assert "test" in result
-        assert result["test"]["command"] == "test"
-        assert result["test"]["executed"] == "pytest"
-        assert result["test"]["stdout"] == "command output"
-        assert result["test"]["stderr"] == ""
-        assert result["test"]["exitcode"] == 0
+    assert "test" in result
+    assert result["test"]["command"] == "test"
+    assert result["test"]["executed"] == "pytest"
+    assert result["test"]["stdout"] == "command output"
+    assert result["test"]["stderr"] == ""
+    assert result["test"]["exitcode"] == 0
 
 
 @pytest.mark.asyncio
-async def test_predefined_commands_exec_with_param(predefined_commands):
+async def test_predefined_commands_exec_with_param(predefined_commands, sub_process):
     """Test execution of a command with a parameter."""
-    # Mock the create_sub_proccess method
-    mock_process = AsyncMock()
-    mock_process.communicate.return_value = (b"command output", b"")
-    mock_process.returncode = 0
-
-    with patch.object(predefined_commands, "create_sub_proccess", return_value=mock_process):
-        result = {}
-        await predefined_commands._exec_commands("test", result, "specific_test")
+    result = {}
+    await predefined_commands._exec_commands("test", result, "specific_test")
 
-        assert "test" in result
-        assert result["test"]["command"] == "test"
-        assert result["test"]["executed"] == "pytest specific_test"
-        assert result["test"]["stdout"] == "command output"
-        assert result["test"]["stderr"] == ""
-        assert result["test"]["exitcode"] == 0
+    assert "test" in result
+    assert result["test"]["command"] == "test"
+    assert result["test"]["executed"] == "pytest specific_test"
+    assert result["test"]["stdout"] == "command output"
+    assert result["test"]["stderr"] == ""
+    assert result["test"]["exitcode"] == 0
 
 
 @pytest.mark.asyncio
@@ -304,7 +320,7 @@ async def test_predefined_commands_exec_subprocess_exception(predefined_commands
 
 
 @pytest.mark.asyncio
-async def test_predefined_commands_exec_with_valid_param(predefined_commands):
+async def test_predefined_commands_exec_with_valid_param(predefined_commands, sub_process):
     """Test execution of a command with valid parameters."""
     # Test with various valid parameters
     valid_params = [
@@ -319,21 +335,15 @@ async def test_predefined_commands_exec_with_valid_param(predefined_commands):
     ]
 
     for valid_param in valid_params:
-        # Mock the create_sub_proccess method
-        mock_process = AsyncMock()
-        mock_process.communicate.return_value = (b"command output", b"")
-        mock_process.returncode = 0
-
-        with patch.object(predefined_commands, "create_sub_proccess", return_value=mock_process):
-            result = {}
-            await predefined_commands._exec_commands("test", result, valid_param)
+        result = {}
+        await predefined_commands._exec_commands("test", result, valid_param)
 
-            assert "test" in result
-            assert result["test"]["command"] == "test"
-            assert result["test"]["executed"] == f"pytest {valid_param}"
-            assert result["test"]["stdout"] == "command output"
-            assert result["test"]["stderr"] == ""
-            assert result["test"]["exitcode"] == 0
+        assert "test" in result
+        assert result["test"]["command"] == "test"
+        assert result["test"]["executed"] == f"pytest {valid_param}"
+        assert result["test"]["stdout"] == "command output"
+        assert result["test"]["stderr"] == ""
+        assert result["test"]["exitcode"] == 0
 
 
 @pytest.mark.asyncio
@@ -362,30 +372,24 @@ async def test_predefined_commands_exec_with_invalid_param(predefined_commands):
 
 
 @pytest.mark.asyncio
-async def test_predefined_commands_exec_nonzero_exit(predefined_commands):
+async def test_predefined_commands_exec_nonzero_exit(predefined_commands, sub_process):
     """Test handling of non-zero exit code."""
-    # Mock the create_sub_proccess method
-    mock_process = AsyncMock()
-    mock_process.communicate.return_value = (b"command output", b"error output")
-    mock_process.returncode = 1
+    sub_process.communicate.return_value = (b"command output", b"error output")
+    sub_process.returncode = 1
 
-    with patch.object(predefined_commands, "create_sub_proccess", return_value=mock_process):
-        result = {}
-        with pytest.raises(RuntimeError, match="non-zero exitcode: 1"):
-            await predefined_commands._exec_commands("test", result)
+    result = {}
+    with pytest.raises(RuntimeError, match="non-zero exitcode: 1"):
+        await predefined_commands._exec_commands("test", result)
 
 
 @pytest.mark.asyncio
-async def test_predefined_commands_exec_with_cov_param(predefined_commands):
+async def test_predefined_commands_exec_with_cov_param(predefined_commands, sub_process):
     """Test execution of a command with a pytest --cov=... param (regression for CLI regex)."""
-    mock_process = AsyncMock()
-    mock_process.communicate.return_value = (b"cov output", b"")
-    mock_process.returncode = 0
+    sub_process.communicate.return_value = (b"cov output", b"")
     param = "--cov=tab_right/drift/drift_calculator.py --cov-report=term-missing"
-    with patch.object(predefined_commands, "create_sub_proccess", return_value=mock_process):
-        result = {}
-        await predefined_commands._exec_commands("test", result, param)
-        assert "test" in result
-        assert result["test"]["executed"].endswith(param)
-        assert result["test"]["stdout"] == "cov output"
-        assert result["test"]["exitcode"] == 0
+    result = {}
+    await predefined_commands._exec_commands("test", result, param)
+    assert "test" in result
+    assert result["test"]["executed"].endswith(param)
+    assert result["test"]["stdout"] == "cov output"
+    assert result["test"]["exitcode"] == 0